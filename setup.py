@@ -7,7 +7,11 @@ setuptools.setup(
     name="genshin-account-switcher",
     version="1.2.2",
     entry_points={
-        "console_scripts": ["genshin-account-switcher=src.main:main"]
+        "console_scripts": ["genshin-account-switcher=src.main:main"],
+        "genshin_account_switcher.backends": [
+            "linux=src.genshin.linux:LinuxBackend",
+            "memory=src.genshin.memory:MemoryBackend",
+        ],
     },
     author="Christopher Kaster",
     author_email="me@atomicptr.de",
@@ -1,8 +1,8 @@
 """ Configuration files per account """
 import json
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, field
 from pathlib import Path
-from typing import Optional, List
+from typing import Dict, Optional, List
 
 from appdirs import user_config_dir
 
@@ -18,6 +18,23 @@ class AccountConfiguration:
         return {k: str(v) for k, v in asdict(self).items()}
 
 
+@dataclass
+class FileManifest:
+    """ Glob patterns of additional game files stored per account, relative
+    to the game data directory """
+    include: List[str] = field(default_factory=list)
+    exclude: List[str] = field(default_factory=list)
+
+
+@dataclass
+class FileSnapshot:
+    """ Record of the additional game files captured for an account and the
+    patterns they were captured with """
+    include: List[str] = field(default_factory=list)
+    exclude: List[str] = field(default_factory=list)
+    paths: List[str] = field(default_factory=list)
+
+
 def get_config_directory() -> Path:
     """ Get the config directory """
     return Path(user_config_dir("genshin-account-switcher"))
@@ -28,6 +45,58 @@ def get_account_directory(uid: str) -> Path:
     return Path(get_config_directory(), "accounts", str(uid))
 
 
+def get_account_files_directory(uid: str) -> Path:
+    """ Get the directory holding the additional game files of an account """
+    return Path(get_account_directory(uid), "files")
+
+
+def _get_pattern_list(data: dict, key: str, file: Path) -> List[str]:
+    value = data.get(key, [])
+    if not isinstance(value, list) \
+            or not all(isinstance(item, str) for item in value):
+        raise ValueError(f"'{key}' in {file} has to be a list of strings")
+    return value
+
+
+def get_file_manifest() -> FileManifest:
+    """ Get the manifest of additional game files stored per account """
+    manifest_file = Path(get_config_directory(), "manifest.json")
+
+    if not manifest_file.exists():
+        return FileManifest()
+
+    data = json.loads(manifest_file.read_text(encoding="utf8"))
+    return FileManifest(
+        include=_get_pattern_list(data, "include", manifest_file),
+        exclude=_get_pattern_list(data, "exclude", manifest_file),
+    )
+
+
+def get_file_snapshot(uid: str) -> Optional[FileSnapshot]:
+    """ Get the record of captured game files or None if there is none """
+    snapshot_file = Path(get_account_directory(str(uid)), "files.json")
+
+    if not snapshot_file.exists():
+        return None
+
+    data = json.loads(snapshot_file.read_text(encoding="utf8"))
+    return FileSnapshot(
+        include=data["include"],
+        exclude=data["exclude"],
+        paths=data["paths"],
+    )
+
+
+def set_file_snapshot(uid: str, snapshot: FileSnapshot) -> None:
+    """ Set the record of captured game files """
+    snapshot_file = Path(get_account_directory(str(uid)), "files.json")
+    snapshot_file.parent.mkdir(parents=True, exist_ok=True)
+    snapshot_file.write_text(
+        json.dumps(asdict(snapshot), indent=4),
+        encoding="utf8"
+    )
+
+
 def get_account_config(uid: str) -> Optional[AccountConfiguration]:
     """ Get the account configuration or None if there is none """
     config_file = Path(get_account_directory(uid), "config.json")
@@ -47,6 +116,10 @@ def set_account_config(uid: str, config: AccountConfiguration) -> None:
         encoding="utf8"
     )
 
+    names_file = _get_account_names_file()
+    if names_file.exists():
+        names_file.unlink()
+
 
 def set_account_name(uid: str, name: str) -> None:
     """ Set account name alias"""
@@ -113,3 +186,23 @@ def get_registered_accounts() -> List[str]:
         lambda path: Path(path).name,
         get_registered_account_paths(),
     ))
+
+
+def _get_account_names_file() -> Path:
+    return Path(get_config_directory(), "accounts", "names.json")
+
+
+def get_account_names() -> Dict[str, Optional[str]]:
+    """ Get the name aliases of all registered accounts by uid, these are
+    cached in a single file instead of reading every account config """
+    accounts = get_registered_accounts()
+    names_file = _get_account_names_file()
+
+    if names_file.exists():
+        names = json.loads(names_file.read_text(encoding="utf8"))
+        if set(names) == set(accounts):
+            return names
+
+    names = {uid: get_account_name(uid) for uid in accounts}
+    names_file.write_text(json.dumps(names, indent=4), encoding="utf8")
+    return names
@@ -1,43 +1,143 @@
 """Module for finding and interacting with the Genshin Impact installation"""
-from typing import List, Optional
+import os
 import platform
+import sys
+from importlib.metadata import entry_points
+from typing import Dict, Iterator, List, Optional, Type
 
 try:
-    from . import linux
+    from .backend import Backend, BackendError
+    from .linux import LinuxBackend
+    from .memory import MemoryBackend
 except ImportError:
-    import linux
+    from backend import Backend, BackendError
+    from linux import LinuxBackend
+    from memory import MemoryBackend
+
+BACKEND_ENTRY_POINT_GROUP = "genshin_account_switcher.backends"
+BACKEND_ENVIRONMENT_VARIABLE = "GENSHIN_ACCOUNT_SWITCHER_BACKEND"
+
+_BUILTIN_BACKENDS: Dict[str, Type[Backend]] = {
+    "linux": LinuxBackend,
+    "memory": MemoryBackend,
+}
+
+_backend: Optional[Backend] = None  # pylint: disable=invalid-name
+
+
+def _iter_backend_names() -> Iterator[str]:
+    # built-in backends come first, entry points are only looked up after
+    yield from _BUILTIN_BACKENDS
+    for entry_point in entry_points(group=BACKEND_ENTRY_POINT_GROUP):
+        if entry_point.name not in _BUILTIN_BACKENDS:
+            yield entry_point.name
+
+
+def get_backend_names() -> List[str]:
+    """ Get the names of all known backends, including those registered by
+    other packages via entry points, without loading them """
+    return list(dict.fromkeys(_iter_backend_names()))
+
+
+def load_backend(name: str) -> Type[Backend]:
+    """ Load the backend class registered under name """
+    if name in _BUILTIN_BACKENDS:
+        return _BUILTIN_BACKENDS[name]
+
+    for entry_point in entry_points(group=BACKEND_ENTRY_POINT_GROUP):
+        if entry_point.name != name:
+            continue
+
+        try:
+            backend = entry_point.load()
+        except Exception as error:  # pylint: disable=broad-except
+            raise BackendError(
+                f"Could not load backend '{name}' "
+                f"({entry_point.value}): {error}"
+            ) from error
+
+        if not isinstance(backend, type) or not issubclass(backend, Backend):
+            raise BackendError(
+                f"Backend '{name}' ({entry_point.value}) is not a Backend"
+            )
+
+        return backend
+
+    raise BackendError(f"Unknown backend: {name}")
+
+
+def _supported_backends() -> Iterator[Backend]:
+    # plugins are only loaded once no earlier backend was chosen
+    for name in _iter_backend_names():
+        try:
+            backend = load_backend(name)
+            if backend.is_supported():
+                yield backend()
+        except Exception as error:  # pylint: disable=broad-except
+            print(f"WARNING: Skipping backend '{name}': {error}",
+                  file=sys.stderr)
+
+
+def _create_backend() -> Backend:
+    name = os.environ.get(BACKEND_ENVIRONMENT_VARIABLE)
+
+    if name:
+        return load_backend(name)()
+
+    # prefer a backend with exactly one installation, otherwise the first
+    # supported one so the caller can report what it found
+    fallback = None
+    for backend in _supported_backends():
+        if len(backend.find_installations()) == 1:
+            return backend
+        if fallback is None:
+            fallback = backend
+
+    if fallback is None:
+        raise NotImplementedError(f"Unsupported OS: {platform.system()}")
+
+    return fallback
+
+
+def get_backend() -> Backend:
+    """ Get the backend, it is chosen once and reused afterwards """
+    global _backend  # pylint: disable=global-statement,invalid-name
+    if _backend is None:
+        _backend = _create_backend()
+    return _backend
+
+
+def set_backend(backend: Optional[Backend]) -> None:
+    """ Replace the backend, None chooses it again on the next call """
+    global _backend  # pylint: disable=global-statement,invalid-name
+    _backend = backend
 
 
 def find_installations() -> List[str]:
     """ Find Genshin Impact installations """
-    if platform.system() == "Linux":
-        return linux.find_installations()
-    raise NotImplementedError(f"Unsupported OS: {platform.system()}")
+    return get_backend().find_installations()
 
 
 def get_uid() -> Optional[str]:
     """ Get the UID of the current installation """
-    if platform.system() == "Linux":
-        return linux.get_uid()
-    raise NotImplementedError(f"Unsupported OS: {platform.system()}")
+    return get_backend().get_uid()
 
 
 def write_uid(uid: str) -> None:
     """ Write a UID to the UidInfo.txt file """
-    if platform.system() == "Linux":
-        return linux.write_uid(uid)
-    raise NotImplementedError(f"Unsupported OS: {platform.system()}")
+    get_backend().write_uid(uid)
 
 
 def read_user_registry() -> Optional[bytes]:
     """ Read the user registry """
-    if platform.system() == "Linux":
-        return linux.read_user_registry()
-    raise NotImplementedError(f"Unsupported OS: {platform.system()}")
+    return get_backend().read_user_registry()
 
 
 def write_user_registry(data: bytes) -> None:
     """ Write the user registry """
-    if platform.system() == "Linux":
-        return linux.write_user_registry(data)
-    raise NotImplementedError(f"Unsupported OS: {platform.system()}")
+    get_backend().write_user_registry(data)
+
+
+def get_game_data_directory() -> Optional[str]:
+    """ Get the directory containing the per user game data """
+    return get_backend().get_game_data_directory()
@@ -0,0 +1,41 @@
+"""Interface implemented by every Genshin Impact installation backend"""
+from abc import ABC, abstractmethod
+from typing import List, Optional
+
+
+class Backend(ABC):
+    """ Access to a Genshin Impact installation, implementations resolve
+    their paths once when they are created """
+
+    @classmethod
+    def is_supported(cls) -> bool:
+        """ Can this backend be selected automatically on this system? """
+        return False
+
+    @abstractmethod
+    def find_installations(self) -> List[str]:
+        """ Find Genshin Impact installations """
+
+    @abstractmethod
+    def get_uid(self) -> Optional[str]:
+        """ Get the UID of the current installation """
+
+    @abstractmethod
+    def write_uid(self, uid: str) -> None:
+        """ Write a UID to the UidInfo.txt file """
+
+    @abstractmethod
+    def read_user_registry(self) -> Optional[bytes]:
+        """ Read the user registry """
+
+    @abstractmethod
+    def write_user_registry(self, data: bytes) -> None:
+        """ Write the user registry """
+
+    @abstractmethod
+    def get_game_data_directory(self) -> Optional[str]:
+        """ Get the directory containing the per user game data """
+
+
+class BackendError(Exception):
+    """ Raised when a backend can not be found or loaded """
@@ -1,9 +1,15 @@
 """Module for finding and interacting with the Linux Genshin Impact
 installation"""
+import platform
 from getpass import getuser
 from pathlib import Path
 from typing import List, Optional
 
+try:
+    from .backend import Backend
+except ImportError:
+    from backend import Backend
+
 _GENSHIN_LOCATIONS = [
     # Anime Game Launcher
     "~/.local/share/anime-game-launcher/Genshin Impact",
@@ -12,80 +18,75 @@ _GENSHIN_LOCATIONS = [
 ]
 
 _USER_REG_PATH = "user.reg"
-_UID_INFO_FILE = "drive_c/users/%s/AppData/LocalLow/miHoYo/" \
-                 "Genshin Impact/UidInfo.txt"
-
-
-def find_installations() -> List[str]:
-    """ Find Genshin Impact installations """
-    dirs = []
-    for location in _GENSHIN_LOCATIONS:
-        location = Path(location).expanduser()
-        if not location.exists():
-            continue
-        dirs.append(str(location))
-    return dirs
-
-
-def _get_install_dir() -> Optional[str]:
-    install_dir = find_installations()
-
-    if len(install_dir) == 0 or len(install_dir) > 1:
-        return None
-
-    return install_dir[0]
-
+_GAME_DATA_DIR = "drive_c/users/%s/AppData/LocalLow/miHoYo/Genshin Impact"
+_UID_INFO_FILE = _GAME_DATA_DIR + "/UidInfo.txt"
 
-def get_uid() -> Optional[str]:
-    """ Get the UID of the current installation """
-    install_dir = _get_install_dir()
 
-    if install_dir is None:
-        return None
+class LinuxBackend(Backend):
+    """ Genshin Impact running inside a Wine prefix, other Wine based
+    launchers can subclass this and pass their own locations """
 
-    uid_path = Path(install_dir, _UID_INFO_FILE % _get_username())
+    def __init__(self, locations: Optional[List[str]] = None):
+        if locations is None:
+            locations = _GENSHIN_LOCATIONS
 
-    if not uid_path.exists():
-        return None
+        self._installations = []
+        for location in locations:
+            location = Path(location).expanduser()
+            if not location.exists():
+                continue
+            self._installations.append(str(location))
 
-    return uid_path.read_text(encoding="utf8").strip()
+        self._install_dir = None
+        if len(self._installations) == 1:
+            self._install_dir = Path(self._installations[0])
 
+        username = _get_username()
+        self._game_data_dir = self._resolve(_GAME_DATA_DIR % username)
+        self._uid_path = self._resolve(_UID_INFO_FILE % username)
+        self._user_reg_path = self._resolve(_USER_REG_PATH)
 
-def write_uid(uid: str) -> None:
-    """ Write a UID to the UidInfo.txt file """
-    install_dir = _get_install_dir()
+    def _resolve(self, path: str) -> Optional[Path]:
+        if self._install_dir is None:
+            return None
+        return Path(self._install_dir, path)
 
-    if install_dir is None:
-        return
+    @classmethod
+    def is_supported(cls) -> bool:
+        return platform.system() == "Linux"
 
-    uid_path = Path(install_dir, _UID_INFO_FILE % _get_username())
-    uid_path.write_text(f"{uid}\n", encoding="utf8")
+    def find_installations(self) -> List[str]:
+        return list(self._installations)
 
+    def get_uid(self) -> Optional[str]:
+        if self._uid_path is None or not self._uid_path.exists():
+            return None
 
-def read_user_registry() -> Optional[bytes]:
-    """ Read the user registry """
-    install_dir = _get_install_dir()
+        return self._uid_path.read_text(encoding="utf8").strip()
 
-    if install_dir is None:
-        return None
+    def write_uid(self, uid: str) -> None:
+        if self._uid_path is None:
+            return
 
-    user_reg_path = Path(install_dir, _USER_REG_PATH)
+        self._uid_path.write_text(f"{uid}\n", encoding="utf8")
 
-    if not user_reg_path.exists():
-        return None
+    def read_user_registry(self) -> Optional[bytes]:
+        if self._user_reg_path is None or not self._user_reg_path.exists():
+            return None
 
-    return user_reg_path.read_bytes()
+        return self._user_reg_path.read_bytes()
 
+    def write_user_registry(self, data: bytes) -> None:
+        if self._user_reg_path is None:
+            return
 
-def write_user_registry(data: bytes) -> None:
-    """ Write the user registry """
-    install_dir = _get_install_dir()
+        self._user_reg_path.write_bytes(data)
 
-    if install_dir is None:
-        return
+    def get_game_data_directory(self) -> Optional[str]:
+        if self._game_data_dir is None:
+            return None
 
-    user_reg_path = Path(install_dir, _USER_REG_PATH)
-    user_reg_path.write_bytes(data)
+        return str(self._game_data_dir)
 
 
 def _get_username() -> str:
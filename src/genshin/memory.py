@@ -0,0 +1,71 @@
+"""Module providing an in-memory Genshin Impact installation for testing and
+benchmarking without a real Wine prefix"""
+import tempfile
+from pathlib import Path
+from typing import List, Optional
+
+try:
+    from .backend import Backend
+except ImportError:
+    from backend import Backend
+
+# prefer tmpfs so game data files never hit the disk
+_TMPFS_DIR = "/dev/shm"
+
+
+class MemoryBackend(Backend):
+    """ Keeps UID and registry in memory, game data files live in a
+    temporary directory on tmpfs when available """
+
+    def __init__(
+            self,
+            uid: Optional[str] = None,
+            user_registry: Optional[bytes] = None,
+            root: Optional[str] = None,
+    ):
+        self._uid = uid
+        self._user_registry = user_registry
+        self._root = root
+        self._temporary_dir: Optional[tempfile.TemporaryDirectory] = None
+
+    def _get_root(self) -> Path:
+        if self._root is None:
+            parent = _TMPFS_DIR if Path(_TMPFS_DIR).is_dir() else None
+            # lives as long as the backend, removed again on cleanup,
+            # garbage collection or exit
+            # pylint: disable-next=consider-using-with
+            self._temporary_dir = tempfile.TemporaryDirectory(
+                prefix="genshin-account-switcher-",
+                dir=parent,
+            )
+            self._root = self._temporary_dir.name
+        return Path(self._root)
+
+    def cleanup(self) -> None:
+        """ Remove the temporary directory if this backend created it """
+        if self._temporary_dir is None:
+            return
+
+        self._temporary_dir.cleanup()
+        self._temporary_dir = None
+        self._root = None
+
+    def find_installations(self) -> List[str]:
+        return [str(self._get_root())]
+
+    def get_uid(self) -> Optional[str]:
+        return self._uid
+
+    def write_uid(self, uid: str) -> None:
+        self._uid = str(uid)
+
+    def read_user_registry(self) -> Optional[bytes]:
+        return self._user_registry
+
+    def write_user_registry(self, data: bytes) -> None:
+        self._user_registry = data
+
+    def get_game_data_directory(self) -> Optional[str]:
+        data_dir = Path(self._get_root(), "Genshin Impact")
+        data_dir.mkdir(parents=True, exist_ok=True)
+        return str(data_dir)
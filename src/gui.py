@@ -86,6 +86,7 @@ class GUI:
             return  # show error?
 
         config.set_user_registry(uid, user_reg_data)
+        utils.capture_account_files(uid)
 
         name = _open_input_field(f"name for '{uid}'", "")
         config.set_account_name(uid, name)
@@ -102,6 +103,7 @@ class GUI:
 
         genshin.write_uid(uid)
         genshin.write_user_registry(user_reg_data)
+        utils.restore_account_files(uid)
 
         self._update_button_states()
 
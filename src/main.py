@@ -4,19 +4,25 @@
 
 import sys
 from argparse import ArgumentParser, Namespace
+from typing import Dict, List, Optional
 
 try:
-    from . import genshin, config, gui, utils
+    from . import genshin, config, gui, search, utils
 except ImportError:
     import genshin
     import config
     import gui
+    import search
     import utils
 
 
 def main():
     """ Main function implementing the CLI command """
-    dirs = genshin.find_installations()
+    try:
+        dirs = genshin.find_installations()
+    except genshin.BackendError as error:
+        print(f"ERROR: {error}")
+        sys.exit(1)
 
     if len(dirs) == 0:
         print("ERROR: No Genshin Installation could be found.")
@@ -50,7 +56,13 @@ def main():
         "switch",
         help="Switch account",
     )
-    parser_switch.add_argument("uid", nargs="?", type=int, default=None)
+    parser_switch.add_argument(
+        "account",
+        nargs="?",
+        type=str,
+        default=None,
+        help="UID, list index or (part of the) account name",
+    )
     parser_switch.set_defaults(func=switch_command, cmd=parser_switch)
 
     parser_current = subparsers.add_parser(
@@ -96,6 +108,7 @@ def register_command(args: Namespace):
         sys.exit(1)
 
     config.set_user_registry(uid, user_reg_data)
+    utils.capture_account_files(uid)
 
     if args.name is not None:
         config.set_account_name(uid, args.name)
@@ -108,11 +121,11 @@ def register_command(args: Namespace):
 
 def switch_command(args: Namespace):
     """ The command responsible for switching accounts"""
-    uid = args.uid
+    query = args.account
 
     registered_accounts = config.get_registered_accounts()
 
-    if uid is None:
+    if query is None:
         if len(registered_accounts) == 0:
             print("ERROR: Could not find any registered accounts, did you run"
                   "the register command already?")
@@ -121,22 +134,33 @@ def switch_command(args: Namespace):
         args.cmd.print_help()
 
         print("\nAvailable UIDs:")
-
-        for index, uid in enumerate(registered_accounts):
-            print(f"* [{index}] {utils.format_uid(uid)} "
-                  f"{utils.check_if_selected(uid)}")
+        _print_accounts(
+            registered_accounts,
+            registered_accounts,
+            config.get_account_names(),
+        )
         sys.exit(0)
 
     # user probably picked an enumerated option
-    if 0 <= int(uid) < len(registered_accounts):
-        uid = registered_accounts[uid]
-
-    if uid not in registered_accounts:
-        print(f"ERROR: Unknown UID '{uid}', available options are:")
-        for index, acc in enumerate(registered_accounts):
-            print(f"* [{index}] {utils.format_uid(str(acc))} "
-                  f"{utils.check_if_selected(str(acc))}")
-        sys.exit(1)
+    if query.isdecimal() and 0 <= int(query) < len(registered_accounts):
+        uid = registered_accounts[int(query)]
+    elif query in registered_accounts:
+        uid = query
+    else:
+        names = config.get_account_names()
+        index = search.AccountIndex(names)
+        uid = index.find(query)
+
+        if uid is None:
+            candidates = [match for match, _score in index.search(query)]
+            if len(candidates) == 0:
+                print(f"ERROR: Unknown account '{query}', available options "
+                      "are:")
+                candidates = registered_accounts
+            else:
+                print(f"ERROR: Account '{query}' is ambiguous, did you mean:")
+            _print_accounts(candidates, registered_accounts, names)
+            sys.exit(1)
 
     user_reg_data = config.get_user_registry(uid)
 
@@ -149,10 +173,26 @@ def switch_command(args: Namespace):
 
     genshin.write_uid(uid)
     genshin.write_user_registry(user_reg_data)
+    utils.restore_account_files(uid)
 
     print(f"Successfully switched to account {utils.format_uid(uid)}")
 
 
+def _print_accounts(
+        uids: List[str],
+        registered_accounts: List[str],
+        names: Dict[str, Optional[str]],
+):
+    """ Print an enumerated list of accounts with the selected one marked """
+    positions = {uid: index for index, uid in enumerate(registered_accounts)}
+    current_uid = str(genshin.get_uid())
+
+    for uid in uids:
+        check = "✔️" if uid == current_uid else ""
+        print(f"* [{positions[uid]}] "
+              f"{utils.format_account(uid, names.get(uid))} {check}")
+
+
 def current_command(_args: Namespace):
     """ Shows your currently selected uid """
     uid = genshin.get_uid()
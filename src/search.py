@@ -0,0 +1,190 @@
+""" In-memory index for looking up accounts by uid or name """
+from bisect import bisect_left
+from collections import Counter
+from typing import Dict, List, Optional, Tuple
+
+_EXACT = 0
+_PREFIX = 1
+_SUBSTRING = 2
+_FUZZY = 3
+
+
+def _normalize(text: str) -> str:
+    return " ".join(text.casefold().split())
+
+
+def edit_distance(first: str, second: str, limit: int) -> int:
+    """ Optimal string alignment distance between two strings, returns
+    limit + 1 as soon as the distance is known to exceed limit """
+    if abs(len(first) - len(second)) > limit:
+        return limit + 1
+
+    # shared affixes never contribute to the distance, skip them
+    start = 0
+    while start < min(len(first), len(second)) \
+            and first[start] == second[start]:
+        start += 1
+    end = 0
+    while end < min(len(first), len(second)) - start \
+            and first[-end - 1] == second[-end - 1]:
+        end += 1
+    first = first[start:len(first) - end]
+    second = second[start:len(second) - end]
+
+    previous_row: List[int] = []
+    row = list(range(len(second) + 1))
+
+    for i, first_char in enumerate(first, start=1):
+        current_row = [i] + [0] * len(second)
+        for j, second_char in enumerate(second, start=1):
+            cost = 0 if first_char == second_char else 1
+            current_row[j] = min(
+                row[j] + 1,
+                current_row[j - 1] + 1,
+                row[j - 1] + cost,
+            )
+            if i > 1 and j > 1 and first_char == second[j - 2] \
+                    and first[i - 2] == second_char:
+                current_row[j] = min(current_row[j], previous_row[j - 2] + 1)
+        if min(current_row) > limit:
+            return limit + 1
+        previous_row, row = row, current_row
+
+    return row[-1]
+
+
+def _histogram_distance(query: Dict[str, int], target: str) -> int:
+    """ Cheap lower bound of the edit distance based on character counts """
+    missing = 0
+    for char, count in query.items():
+        difference = count - target.count(char)
+        if difference > 0:
+            missing += difference
+    return max(missing, missing + len(target) - sum(query.values()))
+
+
+def _fuzzy_limit(query: str) -> int:
+    if len(query) <= 3:
+        return 0
+    if len(query) <= 6:
+        return 1
+    return 2
+
+
+class AccountIndex:
+    """ Index over uids and account names, built once per lookup session """
+    def __init__(self, accounts: Dict[str, Optional[str]]):
+        self._normalized: Dict[str, str] = {}
+        self._exact: Dict[str, List[str]] = {}
+        fuzzy: Dict[str, List[str]] = {}
+        keys: List[Tuple[str, str]] = []
+
+        for uid, name in accounts.items():
+            self._exact.setdefault(uid, []).append(uid)
+            keys.append((uid, uid))
+
+            if not name:
+                continue
+
+            normalized = _normalize(name)
+            self._normalized[uid] = normalized
+            self._exact.setdefault(normalized, []).append(uid)
+            keys.append((normalized, uid))
+
+            # allow prefix matches on each word of the name as well
+            words = normalized.split(" ")
+            for index in range(1, len(words)):
+                keys.append((" ".join(words[index:]), uid))
+
+            for target in set([normalized] + words):
+                fuzzy.setdefault(target, []).append(uid)
+
+        self._keys = sorted(set(keys))
+
+        # fuzzy targets bucketed by length, only buckets within the allowed
+        # distance of the query length have to be looked at
+        self._fuzzy: Dict[int, List[Tuple[str, List[str]]]] = {}
+        for target, uids in fuzzy.items():
+            self._fuzzy.setdefault(len(target), []).append((target, uids))
+
+    def find(self, query: str) -> Optional[str]:
+        """ Find the uid of the only account in the best matching tier or None
+        if the query is ambiguous or has no match """
+        matches = self.search(query)
+
+        if len(matches) == 0:
+            return None
+
+        best_tier = matches[0][1][0]
+        best = [uid for uid, score in matches if score[0] == best_tier]
+
+        if len(best) > 1:
+            return None
+
+        return best[0]
+
+    def search(self, query: str) -> List[Tuple[str, Tuple[int, int]]]:
+        """ Search accounts by uid, name prefix, substring or similar names,
+        returns (uid, score) pairs with the best scores first """
+        query = _normalize(query)
+
+        if not query:
+            return []
+
+        exact = self._exact.get(query)
+        if exact is not None and len(exact) == 1:
+            return [(exact[0], (_EXACT, 0))]
+
+        scores: Dict[str, Tuple[int, int]] = {}
+
+        def add(uid: str, score: Tuple[int, int]):
+            if uid not in scores or score < scores[uid]:
+                scores[uid] = score
+
+        def ranked() -> List[Tuple[str, Tuple[int, int]]]:
+            return sorted(scores.items(), key=lambda item: (item[1], item[0]))
+
+        for uid in exact or []:
+            add(uid, (_EXACT, 0))
+
+        index = bisect_left(self._keys, (query, ""))
+        while index < len(self._keys) and \
+                self._keys[index][0].startswith(query):
+            key, uid = self._keys[index]
+            add(uid, (_PREFIX, len(key) - len(query)))
+            index += 1
+
+        # a unique prefix match can not be beaten by the tiers below
+        if len(scores) == 1:
+            return ranked()
+
+        for uid, normalized in self._normalized.items():
+            if uid in scores:
+                continue
+
+            position = normalized.find(query)
+
+            if position >= 0:
+                add(uid, (_SUBSTRING, position))
+
+        limit = _fuzzy_limit(query)
+
+        if limit > 0:
+            self._add_fuzzy_matches(query, limit, scores, add)
+
+        return ranked()
+
+    def _add_fuzzy_matches(self, query, limit, scores, add):
+        histogram = Counter(query)
+
+        for length in range(len(query) - limit, len(query) + limit + 1):
+            for target, uids in self._fuzzy.get(length, []):
+                if all(uid in scores for uid in uids) \
+                        or _histogram_distance(histogram, target) > limit:
+                    continue
+
+                distance = edit_distance(query, target, limit)
+
+                if distance <= limit:
+                    for uid in uids:
+                        add(uid, (_FUZZY, distance))
@@ -0,0 +1,101 @@
+""" Synchronise additional per account game files """
+import hashlib
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, Iterable, List
+
+_HASH_CHUNK_SIZE = 1024 * 1024
+_MAX_COPY_WORKERS = 8
+
+
+def collect_files(
+        directory: Path,
+        include: List[str],
+        exclude: List[str],
+) -> Dict[str, Path]:
+    """ Collect files matching the include but none of the exclude patterns,
+    keyed by their posix path relative to directory """
+    files = {}
+
+    if not directory.is_dir():
+        return files
+
+    # both lists are expanded with glob so patterns behave the same way
+    excluded = set()
+    for pattern in exclude:
+        excluded.update(directory.glob(pattern))
+
+    for pattern in include:
+        for path in directory.glob(pattern):
+            if not path.is_file() or path in excluded \
+                    or any(parent in excluded for parent in path.parents):
+                continue
+            files[path.relative_to(directory).as_posix()] = path
+
+    return files
+
+
+def _file_hash(path: Path) -> str:
+    digest = hashlib.blake2b()
+    with path.open("rb") as file:
+        while chunk := file.read(_HASH_CHUNK_SIZE):
+            digest.update(chunk)
+    return digest.hexdigest()
+
+
+def _needs_copy(source: Path, target: Path) -> bool:
+    if not target.exists():
+        return True
+
+    source_stat = source.stat()
+    target_stat = target.stat()
+
+    if source_stat.st_size != target_stat.st_size:
+        return True
+
+    if source_stat.st_mtime_ns == target_stat.st_mtime_ns:
+        return False
+
+    if _file_hash(source) != _file_hash(target):
+        return True
+
+    # same content, align mtime so the next sync can skip the hash
+    shutil.copystat(source, target)
+    return False
+
+
+def _sync_file(source: Path, target: Path) -> bool:
+    if not _needs_copy(source, target):
+        return False
+    target.parent.mkdir(parents=True, exist_ok=True)
+    shutil.copy2(source, target)
+    return True
+
+
+def sync_files(
+        files: Dict[str, Path],
+        target_dir: Path,
+        managed: Iterable[str],
+) -> int:
+    """ Copy files (keyed by their relative path) into target_dir, copying
+    only changed files. Managed relative paths in target_dir which are not
+    part of files are removed, nothing else is touched. Returns the amount
+    of copied files """
+    for relative in set(managed) - files.keys():
+        Path(target_dir, relative).unlink(missing_ok=True)
+
+    if len(files) == 0:
+        return 0
+
+    with ThreadPoolExecutor(
+            max_workers=min(_MAX_COPY_WORKERS, len(files))
+    ) as executor:
+        results = executor.map(
+            lambda relative: _sync_file(
+                files[relative],
+                Path(target_dir, relative),
+            ),
+            files.keys(),
+        )
+        return sum(results)
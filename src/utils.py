@@ -1,9 +1,16 @@
 """ Utility functions """
+from pathlib import Path
+from typing import Optional
+
 try:
-    from . import genshin, config
+    from . import genshin, config, sync
 except ImportError:
     import genshin
     import config
+    import sync
+
+# UidInfo.txt is managed by write_uid and must never be restored as a file
+_ALWAYS_EXCLUDED = ["UidInfo.txt"]
 
 
 def backup_current_account_if_possible() -> bool:
@@ -19,17 +26,73 @@ def backup_current_account_if_possible() -> bool:
         return False
 
     config.set_user_registry(uid, user_reg_data)
+    capture_account_files(uid)
     return True
 
 
+def capture_account_files(uid: str) -> int:
+    """ Copy the additional game files listed in the manifest into the
+    account directory, returns the amount of copied files """
+    data_dir = genshin.get_game_data_directory()
+
+    if data_dir is None:
+        return 0
+
+    manifest = config.get_file_manifest()
+    exclude = manifest.exclude + _ALWAYS_EXCLUDED
+    files = sync.collect_files(Path(data_dir), manifest.include, exclude)
+    files_dir = config.get_account_files_directory(str(uid))
+
+    # the files directory only ever contains the latest capture
+    copied = sync.sync_files(
+        files,
+        files_dir,
+        sync.collect_files(files_dir, ["**/*"], []).keys(),
+    )
+    config.set_file_snapshot(uid, config.FileSnapshot(
+        include=manifest.include,
+        exclude=exclude,
+        paths=sorted(files),
+    ))
+    return copied
+
+
+def restore_account_files(uid: str) -> int:
+    """ Copy the additional game files of an account back into the game,
+    returns the amount of copied files """
+    data_dir = genshin.get_game_data_directory()
+    snapshot = config.get_file_snapshot(uid)
+
+    # without a snapshot there is nothing the account claims ownership of
+    if data_dir is None or snapshot is None:
+        return 0
+
+    files_dir = config.get_account_files_directory(str(uid))
+    files = {
+        relative: Path(files_dir, relative)
+        for relative in snapshot.paths
+        if Path(files_dir, relative).is_file()
+    }
+
+    # only files covered by the patterns of the snapshot may be removed
+    return sync.sync_files(
+        files,
+        Path(data_dir),
+        sync.collect_files(
+            Path(data_dir),
+            snapshot.include,
+            snapshot.exclude,
+        ).keys(),
+    )
+
+
 def format_uid(uid: str) -> str:
     """ Displays the account name if available otherwise just the uid"""
-    name = config.get_account_name(uid)
+    return format_account(uid, config.get_account_name(uid))
+
+
+def format_account(uid: str, name: Optional[str]) -> str:
+    """ Displays the given name if available otherwise just the uid"""
     if name is None:
         return f"'{uid}'"
     return f"{name} ({uid})"
-
-
-def check_if_selected(uid: str) -> str:
-    """ Renders a check if the uid is selected right now """
-    return "✔️" if uid == str(genshin.get_uid()) else ""
@@ -0,0 +1,51 @@
+import json
+from pathlib import Path
+
+import pytest
+from src import config
+
+
+def test_get_file_manifest(config_directory):
+    assert config.get_file_manifest() == config.FileManifest()
+
+    manifest_file = Path(config_directory, "manifest.json")
+    manifest_file.write_text(json.dumps({"include": ["**/*.json"]}))
+    assert config.get_file_manifest() == config.FileManifest(
+        include=["**/*.json"],
+    )
+
+
+@pytest.mark.parametrize("manifest", [
+    {"include": "*.json"},
+    {"exclude": "Cache"},
+    {"include": ["*.json", 1]},
+])
+def test_get_file_manifest_rejects_invalid_patterns(config_directory, manifest):
+    Path(config_directory, "manifest.json").write_text(json.dumps(manifest))
+    with pytest.raises(ValueError):
+        config.get_file_manifest()
+
+
+def _register(uid, name=None):
+    config.set_user_registry(uid, f"registry {uid}".encode())
+    if name is not None:
+        config.set_account_name(uid, name)
+
+
+def test_get_account_names_cache(config_directory):
+    _register("700000001", "Main")
+    _register("700000002")
+    names_file = Path(config_directory, "accounts", "names.json")
+
+    assert config.get_account_names() == {"700000001": "Main", "700000002": None}
+    assert json.loads(names_file.read_text()) == config.get_account_names()
+
+    # a newly registered account is picked up
+    _register("700000003", "Alt")
+    assert config.get_account_names()["700000003"] == "Alt"
+
+    # renaming invalidates the cache
+    config.set_account_name("700000001", "Main Account")
+    assert not names_file.exists()
+    assert config.get_account_names()["700000001"] == "Main Account"
+    assert json.loads(names_file.read_text())["700000001"] == "Main Account"
@@ -0,0 +1,25 @@
+from pathlib import Path
+
+import pytest
+from src import config, genshin
+from src.genshin.memory import MemoryBackend
+
+
+@pytest.fixture
+def config_directory(tmp_path, monkeypatch):
+    config_dir = Path(tmp_path, "config")
+    Path(config_dir, "accounts").mkdir(parents=True)
+    monkeypatch.setattr(config, "get_config_directory", lambda: config_dir)
+    return config_dir
+
+
+@pytest.fixture
+def memory_installation(tmp_path):
+    backend = MemoryBackend(
+        uid="700000001",
+        user_registry=b"registry 1",
+        root=str(Path(tmp_path, "game")),
+    )
+    genshin.set_backend(backend)
+    yield backend
+    genshin.set_backend(None)
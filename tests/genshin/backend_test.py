@@ -0,0 +1,146 @@
+import gc
+from pathlib import Path
+
+import pytest
+from src import genshin
+from src.genshin.linux import LinuxBackend
+from src.genshin.memory import MemoryBackend
+
+
+@pytest.fixture(autouse=True)
+def reset_backend():
+    yield
+    genshin.set_backend(None)
+
+
+class _FakeEntryPoint:
+    def __init__(self, name, backend=None, error=None):
+        self.name = name
+        self.value = f"fake:{name}"
+        self.loaded = False
+        self._backend = backend
+        self._error = error
+
+    def load(self):
+        self.loaded = True
+        if self._error is not None:
+            raise self._error
+        return self._backend
+
+
+class _InstalledBackend(MemoryBackend):
+    @classmethod
+    def is_supported(cls):
+        return True
+
+
+class _NotInstalledBackend(_InstalledBackend):
+    def find_installations(self):
+        return []
+
+
+@pytest.fixture
+def plugins(monkeypatch):
+    monkeypatch.delenv(genshin.BACKEND_ENVIRONMENT_VARIABLE, raising=False)
+    plugins = []
+    monkeypatch.setattr(
+        genshin,
+        "entry_points",
+        lambda group: [p for p in plugins
+                       if group == genshin.BACKEND_ENTRY_POINT_GROUP],
+    )
+    return plugins
+
+
+def test_backend_names(plugins):
+    plugins.append(_FakeEntryPoint("proton", _InstalledBackend))
+    plugins.append(_FakeEntryPoint("linux", _InstalledBackend))
+    assert genshin.get_backend_names() == ["linux", "memory", "proton"]
+    assert genshin.load_backend("linux") is LinuxBackend
+    assert genshin.load_backend("memory") is MemoryBackend
+    assert genshin.load_backend("proton") is _InstalledBackend
+    assert not plugins[1].loaded
+
+
+def test_backend_is_chosen_once(monkeypatch):
+    monkeypatch.setenv(genshin.BACKEND_ENVIRONMENT_VARIABLE, "memory")
+    backend = genshin.get_backend()
+    assert isinstance(backend, MemoryBackend)
+    assert genshin.get_backend() is backend
+
+
+def test_unknown_backend(monkeypatch, plugins):
+    monkeypatch.setenv(genshin.BACKEND_ENVIRONMENT_VARIABLE, "unknown")
+    with pytest.raises(genshin.BackendError):
+        genshin.get_backend()
+
+
+def test_broken_backend_selected_explicitly(monkeypatch, plugins):
+    plugins.append(_FakeEntryPoint("broken", error=ImportError("missing")))
+    plugins.append(_FakeEntryPoint("invalid", object))
+    monkeypatch.setenv(genshin.BACKEND_ENVIRONMENT_VARIABLE, "broken")
+    with pytest.raises(genshin.BackendError, match="missing"):
+        genshin.get_backend()
+    monkeypatch.setenv(genshin.BACKEND_ENVIRONMENT_VARIABLE, "invalid")
+    with pytest.raises(genshin.BackendError, match="not a Backend"):
+        genshin.get_backend()
+
+
+def test_plugins_are_not_loaded_when_builtin_is_installed(
+        monkeypatch, plugins):
+    monkeypatch.setitem(genshin._BUILTIN_BACKENDS, "linux", _InstalledBackend)
+    plugins.append(_FakeEntryPoint("proton", _InstalledBackend))
+    assert type(genshin.get_backend()) is _InstalledBackend
+    assert not plugins[0].loaded
+
+
+def test_plugin_with_installation_is_preferred(monkeypatch, plugins, capsys):
+    monkeypatch.setitem(
+        genshin._BUILTIN_BACKENDS, "linux", _NotInstalledBackend)
+    plugins.append(_FakeEntryPoint("broken", error=ImportError("missing")))
+    plugins.append(_FakeEntryPoint("proton", _InstalledBackend))
+    assert type(genshin.get_backend()) is _InstalledBackend
+    assert "WARNING: Skipping backend 'broken'" in capsys.readouterr().err
+
+
+def test_fallback_without_installation(monkeypatch, plugins):
+    monkeypatch.setitem(
+        genshin._BUILTIN_BACKENDS, "linux", _NotInstalledBackend)
+    assert type(genshin.get_backend()) is _NotInstalledBackend
+
+
+def test_memory_backend(tmp_path):
+    genshin.set_backend(MemoryBackend(root=str(tmp_path)))
+    assert genshin.find_installations() == [str(tmp_path)]
+    assert genshin.get_uid() is None
+    assert genshin.read_user_registry() is None
+
+    genshin.write_uid("888888888")
+    genshin.write_user_registry(b"Test")
+    assert genshin.get_uid() == "888888888"
+    assert genshin.read_user_registry() == b"Test"
+
+    data_dir = Path(genshin.get_game_data_directory())
+    assert data_dir.is_dir()
+    assert data_dir.parent == tmp_path
+
+
+def test_memory_backend_cleanup():
+    backend = MemoryBackend()
+    root = Path(backend.find_installations()[0])
+    assert root.is_dir()
+    backend.cleanup()
+    assert not root.exists()
+
+    backend = MemoryBackend()
+    root = Path(backend.get_game_data_directory()).parent
+    del backend
+    gc.collect()
+    assert not root.exists()
+
+
+def test_memory_backend_keeps_given_root(tmp_path):
+    backend = MemoryBackend(root=str(tmp_path))
+    backend.get_game_data_directory()
+    backend.cleanup()
+    assert tmp_path.is_dir()
@@ -3,10 +3,10 @@ import tempfile
 import time
 from getpass import getuser
 from pathlib import Path
-from unittest.mock import patch
 
 import pytest
 from src import genshin
+from src.genshin.linux import LinuxBackend
 
 _test_location = Path(
     tempfile.gettempdir(),
@@ -30,46 +30,59 @@ def genshin_installation():
 
     print(_test_location)
     shutil.rmtree(_test_location)
+    genshin.set_backend(None)
+
+
+def _use_location(location):
+    genshin.set_backend(LinuxBackend([location]))
 
 
 def test_find_installations(genshin_installation):
-    with patch("src.genshin.linux._GENSHIN_LOCATIONS", ["/home/test-user/gi"]):
-        assert len(genshin.find_installations()) == 0
-    with patch("src.genshin.linux._GENSHIN_LOCATIONS", [_test_location]):
-        assert len(genshin.find_installations()) > 0
+    _use_location("/home/test-user/gi")
+    assert len(genshin.find_installations()) == 0
+    _use_location(_test_location)
+    assert len(genshin.find_installations()) > 0
 
 
 def test_get_uid(genshin_installation):
-    with patch("src.genshin.linux._GENSHIN_LOCATIONS", ["/home/test-user/gi"]):
-        assert genshin.get_uid() is None
-    with patch("src.genshin.linux._GENSHIN_LOCATIONS", [_test_location]):
-        assert genshin.get_uid() == "999999999"
+    _use_location("/home/test-user/gi")
+    assert genshin.get_uid() is None
+    _use_location(_test_location)
+    assert genshin.get_uid() == "999999999"
 
 
 def test_set_uid(genshin_installation):
-    with patch("src.genshin.linux._GENSHIN_LOCATIONS", ["/home/test-user/gi"]):
-        assert genshin.get_uid() is None
-        genshin.write_uid("888888888")
-        assert genshin.get_uid() is None
-    with patch("src.genshin.linux._GENSHIN_LOCATIONS", [_test_location]):
-        assert genshin.get_uid() == "999999999"
-        genshin.write_uid("888888888")
-        assert genshin.get_uid() == "888888888"
+    _use_location("/home/test-user/gi")
+    assert genshin.get_uid() is None
+    genshin.write_uid("888888888")
+    assert genshin.get_uid() is None
+    _use_location(_test_location)
+    assert genshin.get_uid() == "999999999"
+    genshin.write_uid("888888888")
+    assert genshin.get_uid() == "888888888"
 
 
 def test_read_user_registry(genshin_installation):
-    with patch("src.genshin.linux._GENSHIN_LOCATIONS", ["/home/test-user/gi"]):
-        assert genshin.read_user_registry() is None
-    with patch("src.genshin.linux._GENSHIN_LOCATIONS", [_test_location]):
-        assert genshin.read_user_registry() is not None
+    _use_location("/home/test-user/gi")
+    assert genshin.read_user_registry() is None
+    _use_location(_test_location)
+    assert genshin.read_user_registry() is not None
 
 
 def test_write_user_registry(genshin_installation):
-    with patch("src.genshin.linux._GENSHIN_LOCATIONS", ["/home/test-user/gi"]):
-        assert genshin.read_user_registry() is None
-        genshin.write_user_registry(b"Test")
-        assert genshin.read_user_registry() is None
-    with patch("src.genshin.linux._GENSHIN_LOCATIONS", [_test_location]):
-        data = genshin.read_user_registry()
-        genshin.write_user_registry(b"Test")
-        assert data != genshin.read_user_registry()
+    _use_location("/home/test-user/gi")
+    assert genshin.read_user_registry() is None
+    genshin.write_user_registry(b"Test")
+    assert genshin.read_user_registry() is None
+    _use_location(_test_location)
+    data = genshin.read_user_registry()
+    genshin.write_user_registry(b"Test")
+    assert data != genshin.read_user_registry()
+
+
+def test_get_game_data_directory(genshin_installation):
+    _use_location("/home/test-user/gi")
+    assert genshin.get_game_data_directory() is None
+    _use_location(_test_location)
+    data_dir = Path(genshin.get_game_data_directory())
+    assert Path(data_dir, "UidInfo.txt").exists()
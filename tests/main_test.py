@@ -0,0 +1,63 @@
+from argparse import Namespace
+
+import pytest
+from src import config, main
+
+
+@pytest.fixture
+def accounts(config_directory, memory_installation):
+    for uid, name in [
+            ("700000001", "Main Account"),
+            ("700000002", "Mainland"),
+            ("700000003", "Alt"),
+    ]:
+        config.set_user_registry(uid, f"registry {uid[-1]}".encode())
+        config.set_account_name(uid, name)
+    return config.get_registered_accounts()
+
+
+def _switch(account):
+    main.switch_command(Namespace(account=account, cmd=None))
+
+
+@pytest.mark.parametrize("query, uid", [
+    ("alt", "700000003"),
+    ("mainlnd", "700000002"),
+    ("700000002", "700000002"),
+])
+def test_switch(accounts, memory_installation, capsys, query, uid):
+    _switch(query)
+    assert memory_installation.get_uid() == uid
+    assert memory_installation.read_user_registry() == \
+        f"registry {uid[-1]}".encode()
+    assert "Successfully switched" in capsys.readouterr().out
+
+
+def test_switch_by_index(accounts, memory_installation):
+    _switch("2")
+    assert memory_installation.get_uid() == accounts[2]
+
+
+def test_switch_ambiguous(accounts, memory_installation, capsys):
+    with pytest.raises(SystemExit) as error:
+        _switch("main")
+    assert error.value.code == 1
+    assert memory_installation.get_uid() == "700000001"
+
+    output = capsys.readouterr().out
+    assert "ERROR: Account 'main' is ambiguous" in output
+    assert "Mainland (700000002)" in output
+    assert "Main Account (700000001) ✔️" in output
+    assert "Alt" not in output
+
+
+@pytest.mark.parametrize("query", ["zzzz", "²", "99"])
+def test_switch_unknown(accounts, memory_installation, capsys, query):
+    with pytest.raises(SystemExit) as error:
+        _switch(query)
+    assert error.value.code == 1
+    assert memory_installation.get_uid() == "700000001"
+
+    output = capsys.readouterr().out
+    assert f"ERROR: Unknown account '{query}'" in output
+    assert output.count("* [") == len(accounts)
@@ -0,0 +1,67 @@
+from src import search
+
+_accounts = {
+    "700000001": "Main Account",
+    "700000002": "Alt Account",
+    "700000003": "Mainland",
+    "700000004": None,
+    "800000005": "Lumine",
+}
+
+
+def test_edit_distance():
+    assert search.edit_distance("lumine", "lumine", 2) == 0
+    assert search.edit_distance("lumnie", "lumine", 2) == 1
+    assert search.edit_distance("lumin", "lumine", 2) == 1
+    assert search.edit_distance("aether", "lumine", 2) == 3
+
+
+def test_find_exact():
+    index = search.AccountIndex(_accounts)
+    assert index.find("700000004") == "700000004"
+    assert index.find("main account") == "700000001"
+    assert index.find("  LUMINE ") == "800000005"
+
+
+def test_find_prefix_and_substring():
+    index = search.AccountIndex(_accounts)
+    assert index.find("8") == "800000005"
+    assert index.find("alt") == "700000002"
+    assert index.find("land") == "700000003"
+    # matches the word "Account" of both accounts equally well
+    assert index.find("acc") is None
+
+
+def test_find_same_tier_is_ambiguous():
+    index = search.AccountIndex({"1": "Alt", "2": "Alt 2", "3": "Alt 3"})
+    assert index.find("alt") == "1"
+    assert index.find("al") is None
+    assert [uid for uid, _score in index.search("al")] == ["1", "2", "3"]
+
+
+def test_find_typo():
+    index = search.AccountIndex(_accounts)
+    assert index.find("lumnie") == "800000005"
+    assert index.find("xyz") is None
+
+
+def test_search_ranking():
+    index = search.AccountIndex(_accounts)
+    matches = [uid for uid, _score in index.search("main")]
+    assert matches == ["700000003", "700000001"]
+    # both are prefix matches, switching to either would be a guess
+    assert index.find("main") is None
+    assert index.search("") == []
+
+
+def test_search_large_account_set():
+    accounts = {str(100000000 + i): f"Account {i}" for i in range(5000)}
+    index = search.AccountIndex(accounts)
+    assert index.find("account 4242") == "100004242"
+    assert index.find("4242") == "100004242"
+    matches = index.search("424")
+    assert matches[0][0] == "100000424"
+    assert len(matches) == 15
+    matches = index.search("acount 4242")
+    assert matches[0][0] == "100004242"
+    assert index.find("acount 4242") is None
@@ -0,0 +1,112 @@
+import json
+import os
+from pathlib import Path
+
+import pytest
+from src import sync
+
+
+@pytest.fixture
+def directories(tmp_path):
+    source = Path(tmp_path, "source")
+    target = Path(tmp_path, "target")
+    Path(source, "Settings").mkdir(parents=True)
+    Path(source, "Cache").mkdir(parents=True)
+    Path(source, "Settings", "graphics.json").write_text("high")
+    Path(source, "Settings", "input.json").write_text("keyboard")
+    Path(source, "Cache", "blob.bin").write_bytes(b"cache")
+    Path(source, "UidInfo.txt").write_text("999999999\n")
+    return source, target
+
+
+def test_collect_files(directories):
+    source, _ = directories
+    files = sync.collect_files(source, ["**/*"], ["Cache/*", "UidInfo.txt"])
+    assert sorted(files) == ["Settings/graphics.json", "Settings/input.json"]
+    assert sync.collect_files(Path(source, "missing"), ["**/*"], []) == {}
+
+
+def _sync(source, target, include):
+    return sync.sync_files(
+        sync.collect_files(source, include, []),
+        target,
+        sync.collect_files(target, include, []).keys(),
+    )
+
+
+def test_sync_files(directories):
+    source, target = directories
+    assert _sync(source, target, ["Settings/*"]) == 2
+    assert Path(target, "Settings", "graphics.json").read_text() == "high"
+    assert not Path(target, "Cache").exists()
+    # nothing changed, nothing to copy
+    assert _sync(source, target, ["Settings/*"]) == 0
+
+
+def test_sync_files_only_copies_changes(directories):
+    source, target = directories
+    _sync(source, target, ["Settings/*"])
+
+    Path(source, "Settings", "graphics.json").write_text("lowest")
+    assert _sync(source, target, ["Settings/*"]) == 1
+    assert Path(target, "Settings", "graphics.json").read_text() == "lowest"
+
+    # same content, different mtime
+    os.utime(Path(source, "Settings", "input.json"), (0, 0))
+    assert _sync(source, target, ["Settings/*"]) == 0
+    assert _sync(source, target, ["Settings/*"]) == 0
+
+    # same size and different content
+    Path(source, "Settings", "input.json").write_text("keybaord")
+    assert _sync(source, target, ["Settings/*"]) == 1
+    assert Path(target, "Settings", "input.json").read_text() == "keybaord"
+
+
+def test_sync_files_removes_managed_files_only(directories):
+    source, target = directories
+    _sync(source, target, ["Settings/*"])
+    Path(target, "Settings", "stale.json").write_text("stale")
+    Path(target, "unmanaged.txt").write_text("keep me")
+
+    _sync(source, target, ["Settings/*"])
+    assert not Path(target, "Settings", "stale.json").exists()
+    assert Path(target, "unmanaged.txt").exists()
+
+    files = sync.collect_files(source, ["Settings/*"], [])
+    sync.sync_files(files, target, ["unmanaged.txt", "missing.txt"])
+    assert not Path(target, "unmanaged.txt").exists()
+
+
+def test_collect_files_readme_manifest(directories):
+    source, _ = directories
+    Path(source, "Cache", "a.json").write_text("{}")
+    Path(source, "Settings", "Cache").mkdir()
+    Path(source, "Settings", "Cache", "b.json").write_text("{}")
+    Path(source, "Cache", "sub").mkdir()
+    Path(source, "Cache", "sub", "c.json").write_text("{}")
+    manifest = json.loads("""
+    {
+        "include": ["**/*.json", "**/*.txt"],
+        "exclude": ["**/Cache/*"]
+    }
+    """)
+    files = sync.collect_files(
+        source,
+        manifest["include"],
+        manifest["exclude"],
+    )
+    assert sorted(files) == [
+        "Settings/graphics.json",
+        "Settings/input.json",
+        "UidInfo.txt",
+    ]
+
+
+@pytest.mark.parametrize("pattern", ["Cache", "**/Cache", "**/Cache/*"])
+def test_collect_files_excludes_directories(directories, pattern):
+    source, _ = directories
+    Path(source, "Cache", "sub").mkdir()
+    Path(source, "Cache", "sub", "c.json").write_text("{}")
+    files = sync.collect_files(source, ["**/*"], [pattern])
+    assert not any(relative.startswith("Cache/") for relative in files)
+    assert "Settings/graphics.json" in files
@@ -0,0 +1,88 @@
+import json
+from argparse import Namespace
+from pathlib import Path
+
+import pytest
+from src import config, main
+
+
+@pytest.fixture
+def game_data(config_directory, memory_installation):
+    Path(config_directory, "manifest.json").write_text(json.dumps({
+        "include": ["**/*.json", "**/*.txt"],
+        "exclude": ["**/Cache"],
+    }))
+    data_dir = Path(memory_installation.get_game_data_directory())
+    Path(data_dir, "Cache").mkdir()
+    Path(data_dir, "Cache", "blob.json").write_text("cache")
+    Path(data_dir, "settings.json").write_text("account 1")
+    Path(data_dir, "UidInfo.txt").write_text("700000001\n")
+    return data_dir
+
+
+def _login(backend, data_dir, uid, settings):
+    backend.write_uid(uid)
+    backend.write_user_registry(f"registry {uid[-1]}".encode())
+    Path(data_dir, "settings.json").write_text(settings)
+
+
+def _switch(account):
+    main.switch_command(Namespace(account=account, cmd=None))
+
+
+def test_register_captures_files(game_data):
+    main.register_command(Namespace(name=None))
+
+    files_dir = config.get_account_files_directory("700000001")
+    assert Path(files_dir, "settings.json").read_text() == "account 1"
+    assert not Path(files_dir, "UidInfo.txt").exists()
+    assert not Path(files_dir, "Cache").exists()
+    assert config.get_file_snapshot("700000001").paths == ["settings.json"]
+
+
+def test_switch_backs_up_and_restores_files(game_data, memory_installation):
+    main.register_command(Namespace(name=None))
+    _login(memory_installation, game_data, "700000002", "account 2")
+    main.register_command(Namespace(name=None))
+
+    Path(game_data, "settings.json").write_text("account 2 changed")
+    _switch("700000001")
+    assert memory_installation.get_uid() == "700000001"
+    assert memory_installation.read_user_registry() == b"registry 1"
+    assert Path(game_data, "settings.json").read_text() == "account 1"
+    assert Path(game_data, "UidInfo.txt").read_text() == "700000001\n"
+    assert Path(game_data, "Cache", "blob.json").exists()
+
+    _switch("700000002")
+    assert Path(game_data, "settings.json").read_text() == \
+        "account 2 changed"
+
+
+def test_restore_removes_only_files_covered_by_snapshot(
+        game_data, config_directory, memory_installation):
+    Path(config_directory, "manifest.json").write_text(json.dumps({
+        "include": ["**/*.json"],
+    }))
+    main.register_command(Namespace(name=None))
+    _login(memory_installation, game_data, "700000002", "account 2")
+    Path(game_data, "extra.json").write_text("only account 2")
+    Path(game_data, "log.txt").write_text("log")
+
+    # widening the manifest must not delete files the snapshot never saw
+    Path(config_directory, "manifest.json").write_text(json.dumps({
+        "include": ["**/*.json", "**/*.txt"],
+    }))
+    config.set_user_registry("700000002", b"registry 2")
+    _switch("700000001")
+
+    assert Path(game_data, "settings.json").read_text() == "account 1"
+    assert not Path(game_data, "extra.json").exists()
+    assert Path(game_data, "log.txt").read_text() == "log"
+
+
+def test_restore_without_snapshot_keeps_files(game_data, memory_installation):
+    config.set_user_registry("700000002", b"registry 2")
+    _switch("700000002")
+
+    assert memory_installation.get_uid() == "700000002"
+    assert Path(game_data, "settings.json").read_text() == "account 1"